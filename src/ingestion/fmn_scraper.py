@@ -17,14 +17,25 @@ import os
 import re
 import time
 import json
+import hashlib
 import logging
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from urllib.parse import urljoin, urlparse, unquote
 from pathlib import Path
-from typing import Optional, List, Dict, Set, Tuple
+from typing import Optional, List, Dict, NamedTuple, Set, Tuple
+
+try:
+    import orjson  # serialización JSON en C, opcional
+except ImportError:
+    orjson = None
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
 
 # Configuración de logging
 logging.basicConfig(
@@ -34,6 +45,55 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Expresiones regulares precompiladas (se aplican a cada enlace/página,
+# compilarlas una sola vez evita pasar por la caché interna de re)
+_SEASON_RE = re.compile(r'(\d{2})-(\d{2})')
+_YEAR_RE = re.compile(r'(20\d{2})')
+_COMP_LINK_RE = re.compile(r'/competiciones-natacion/(\d+)-(.+?)(?:/|$)')
+_TITLE_PREFIX_RE = re.compile(r'^NATACIÓN')
+_DATE_RE = re.compile(r'(\d{1,2})\s+de\s+(\w+)\s+de\s+(\d{4})', re.IGNORECASE)
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+_PAGE_PARAM_RE = re.compile(rb'\?page=(\d+)')
+
+
+@lru_cache(maxsize=1024)
+def _extract_year_from_text(text: str, start_year: int, end_year: int) -> int:
+    """Extrae el año de la temporada del texto (ej: '22-23' -> 2022)."""
+    # Buscar patrón de temporada XX-YY
+    season_match = _SEASON_RE.search(text)
+    if season_match:
+        year = int('20' + season_match.group(1))
+        if start_year <= year <= end_year:
+            return year
+
+    # Buscar año explícito 20XX
+    year_match = _YEAR_RE.search(text)
+    if year_match:
+        return int(year_match.group(1))
+
+    return datetime.now().year
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_filename(name: str) -> str:
+    """Limpia un nombre para usarlo como nombre de archivo."""
+    # Reemplazar caracteres no válidos
+    name = _INVALID_CHARS_RE.sub('_', name)
+    name = _WHITESPACE_RE.sub('_', name)
+    name = _UNDERSCORE_RUN_RE.sub('_', name)
+    name = name.strip('._-')
+    return name[:100] if len(name) > 100 else name
+
+
+class Competition(NamedTuple):
+    """Competición encontrada en el calendario (esquema fijo, sin dict)."""
+    id: str
+    url: str
+    title: str
+    season_year: int
+
 
 class FMNScraper:
     """
@@ -57,7 +117,8 @@ class FMNScraper:
         delay_between_requests: float = 1.0,
         max_pages: Optional[int] = None,
         start_year: int = 2018,
-        end_year: Optional[int] = None
+        end_year: Optional[int] = None,
+        max_workers: int = 8
     ):
         """
         Inicializa el scraper.
@@ -68,27 +129,69 @@ class FMNScraper:
             max_pages: Número máximo de páginas (None = detectar automáticamente)
             start_year: Año inicial para filtrar competiciones
             end_year: Año final para filtrar competiciones (None = año actual)
+            max_workers: Hilos para procesar competiciones en paralelo
         """
         self.output_base_dir = Path(output_base_dir)
         self.delay = delay_between_requests
         self.max_pages = max_pages  # None = dinámico
         self.start_year = start_year
         self.end_year = end_year or datetime.now().year
+        self.max_workers = max_workers
 
-        # Sesión HTTP para mantener cookies
+        # Sesión HTTP para mantener cookies (compartida entre hilos; el pool
+        # de conexiones keep-alive se dimensiona al número de hilos)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'es-ES,es;q=0.9,en;q=0.8',
         })
+        # Reintentos con backoff para errores transitorios del servidor;
+        # al ser un solo host basta con un pool de conexiones keep-alive
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Sincronización entre hilos: las estadísticas se protegen con un
+        # lock; los sets de duplicados usan add(), que es atómico bajo el GIL
+        self._stats_lock = threading.Lock()
+
+        # Cubo de tokens para limitar el ritmo de peticiones: se repone a
+        # 1/delay tokens por segundo, con capacidad para una ráfaga corta
+        self._rate_lock = threading.Lock()
+        self._tokens = float(max_workers)
+        self._last_refill = time.monotonic()
 
         # Conjuntos para evitar duplicados
         self.processed_competitions: Set[str] = set()
         self.downloaded_files: Set[str] = set()
+
+        # SHA256 de los archivos ya descargados: detecta el mismo ZIP
+        # publicado bajo otra URL u otro nombre
+        self.file_hashes: Set[str] = set()
+
+        # HTML de la página 1 cacheado por _detect_total_pages para no
+        # volver a pedirla al empezar a recorrer el calendario
+        self._page1_content: Optional[bytes] = None
+
+        # Validadores HTTP (ETag / Last-Modified) por página del calendario,
+        # para peticiones GET condicionales entre ejecuciones
+        self.page_validators: Dict[str, Dict[str, str]] = {}
         
-        # Archivo de registro para persistir competiciones descargadas
+        # Archivo de registro para persistir competiciones descargadas.
+        # El flag se activa con cada mutación de los campos persistidos y
+        # permite saltarse volcados sin cambios (también lo activa
+        # _load_registry si descarta validadores obsoletos)
         self.registry_file = self.output_base_dir / ".downloaded_competitions.json"
+        self._registry_dirty = False
         self._load_registry()
 
         # Estadísticas
@@ -99,6 +202,7 @@ class FMNScraper:
             'competitions_with_res': 0,
             'files_downloaded': 0,
             'files_skipped': 0,
+            'pages_not_modified': 0,
             'errors': 0
         }
 
@@ -106,78 +210,177 @@ class FMNScraper:
         """Carga el registro de competiciones ya descargadas."""
         if self.registry_file.exists():
             try:
-                with open(self.registry_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.downloaded_files = set(data.get('downloaded_urls', []))
-                    self.processed_competitions = set(data.get('competition_ids', []))
+                with open(self.registry_file, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                self.downloaded_files = set(data.get('downloaded_urls', []))
+                self.processed_competitions = set(data.get('competition_ids', []))
+                self.file_hashes = set(data.get('file_hashes', []))
+
+                # Los validadores solo valen si el rango de años no cambió:
+                # con un rango más amplio, un 304 ocultaría competiciones que
+                # antes se filtraban y ahora sí interesan
+                if data.get('year_range') == [self.start_year, self.end_year]:
+                    self.page_validators = data.get('page_validators', {})
+                elif data.get('page_validators'):
+                    logger.info(
+                        "Rango de años distinto al del registro; "
+                        "se descartan los validadores de caché"
+                    )
+                    self._registry_dirty = True
                 logger.info(f"Registro cargado: {len(self.processed_competitions)} competiciones previas")
-            except (json.JSONDecodeError, IOError) as e:
+            except (ValueError, IOError) as e:
                 logger.warning(f"Error al cargar registro: {e}")
                 self.downloaded_files = set()
                 self.processed_competitions = set()
 
     def _save_registry(self) -> None:
-        """Guarda el registro de competiciones descargadas."""
+        """
+        Guarda el registro de competiciones descargadas.
+
+        El volcado se omite si nada cambió desde el último guardado, y se
+        escribe primero a un archivo temporal que se renombra de forma
+        atómica, para que una interrupción nunca deje el registro corrupto.
+        """
+        if not self._registry_dirty:
+            return
+
+        payload = {
+            'downloaded_urls': list(self.downloaded_files),
+            'competition_ids': list(self.processed_competitions),
+            'file_hashes': list(self.file_hashes),
+            'page_validators': self.page_validators,
+            'year_range': [self.start_year, self.end_year],
+            'last_updated': datetime.now().isoformat()
+        }
+
+        tmp_file = self.registry_file.with_suffix('.json.tmp')
         try:
             self.output_base_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.registry_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'downloaded_urls': list(self.downloaded_files),
-                    'competition_ids': list(self.processed_competitions),
-                    'last_updated': datetime.now().isoformat()
-                }, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                raw = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+            else:
+                raw = json.dumps(payload, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(tmp_file, 'wb') as f:
+                f.write(raw)
+            os.replace(tmp_file, self.registry_file)
+            self._registry_dirty = False
         except IOError as e:
             logger.error(f"Error al guardar registro: {e}")
 
-    def _make_request(self, url: str, stream: bool = False) -> Optional[requests.Response]:
+    def _inc_stat(self, key: str, amount: int = 1) -> None:
+        """Incrementa una estadística de forma segura entre hilos."""
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _throttle(self) -> None:
+        """
+        Limita el ritmo de peticiones con un cubo de tokens.
+
+        Los tokens se reponen a 1/delay por segundo hasta una capacidad de
+        max_workers, de modo que tras una pausa (parseo, escritura a disco)
+        los hilos pueden lanzar una ráfaga corta sin superar el ritmo medio.
+        Todo el tráfico va al mismo host, así que el cubo es único.
+        """
+        if self.delay <= 0:
+            return
+        while True:
+            with self._rate_lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self.max_workers),
+                    self._tokens + (now - self._last_refill) / self.delay
+                )
+                self._last_refill = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) * self.delay
+            time.sleep(wait)
+
+    def _make_request(
+        self,
+        url: str,
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[requests.Response]:
         """Realiza una petición HTTP con manejo de errores."""
         try:
-            time.sleep(self.delay)
-            response = self.session.get(url, timeout=30, stream=stream)
+            self._throttle()
+            response = self.session.get(url, timeout=30, stream=stream, headers=headers)
             response.raise_for_status()
             return response
         except requests.exceptions.Timeout:
             logger.error(f"Timeout: {url}")
-            self.stats['errors'] += 1
+            self._inc_stat('errors')
         except requests.exceptions.ConnectionError:
             logger.error(f"Error de conexión: {url}")
-            self.stats['errors'] += 1
+            self._inc_stat('errors')
         except requests.exceptions.HTTPError as e:
             logger.error(f"Error HTTP {e.response.status_code}: {url}")
-            self.stats['errors'] += 1
+            self._inc_stat('errors')
         except requests.exceptions.RequestException as e:
             logger.error(f"Error: {e}")
-            self.stats['errors'] += 1
+            self._inc_stat('errors')
         return None
 
-    def _extract_year_from_text(self, text: str) -> int:
-        """Extrae el año de la temporada del texto (ej: '22-23' -> 2022)."""
-        # Buscar patrón de temporada XX-YY
-        season_match = re.search(r'(\d{2})-(\d{2})', text)
-        if season_match:
-            year = int('20' + season_match.group(1))
-            if self.start_year <= year <= self.end_year:
-                return year
-        
-        # Buscar año explícito 20XX
-        year_match = re.search(r'(20\d{2})', text)
-        if year_match:
-            return int(year_match.group(1))
-        
-        return datetime.now().year
-
-    def _sanitize_filename(self, name: str) -> str:
-        """Limpia un nombre para usarlo como nombre de archivo."""
-        # Reemplazar caracteres no válidos
-        name = re.sub(r'[<>:"/\\|?*]', '_', name)
-        name = re.sub(r'\s+', '_', name)
-        name = re.sub(r'_+', '_', name)
-        name = name.strip('._-')
-        return name[:100] if len(name) > 100 else name
-
-    def _extract_date_from_page(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extrae la fecha de la competición del contenido de la página."""
-        text = soup.get_text()
+    def _fetch_calendar_page(self, url: str) -> Optional[bytes]:
+        """
+        Descarga una página del calendario con GET condicional.
+
+        Envía If-None-Match / If-Modified-Since con los validadores guardados
+        de ejecuciones anteriores; si el servidor responde 304 la página no ha
+        cambiado y se devuelve None sin cuerpo que parsear.
+        """
+        validators = self.page_validators.get(url, {})
+        headers = {}
+        if 'etag' in validators:
+            headers['If-None-Match'] = validators['etag']
+        if 'last_modified' in validators:
+            headers['If-Modified-Since'] = validators['last_modified']
+
+        response = self._make_request(url, headers=headers or None)
+        if not response:
+            return None
+
+        if response.status_code == 304:
+            logger.info("Página sin cambios desde la última ejecución (304)")
+            self._inc_stat('pages_not_modified')
+            return None
+
+        self._store_validators(url, response)
+        return response.content
+
+    def _store_validators(self, url: str, response: requests.Response) -> None:
+        """Guarda los validadores de caché (ETag / Last-Modified) de una página."""
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['last_modified'] = response.headers['Last-Modified']
+        if validators:
+            self.page_validators[url] = validators
+            self._registry_dirty = True
+
+    def _iter_anchors(self, content: bytes):
+        """
+        Itera los elementos <a> de una página sin construir el DOM completo.
+
+        Usa HTMLPullParser con tag='a', de forma que solo se materializan
+        los enlaces y el resto del documento (tablas, menús, etc.) nunca
+        llega a ser un objeto Python. Cada elemento se libera tras cederlo.
+        La codificación se fija a UTF-8: sin ella libxml2 dependería de un
+        <meta charset> y caería a latin-1, corrompiendo los títulos.
+        """
+        parser = etree.HTMLPullParser(events=('end',), tag='a', encoding='utf-8')
+        parser.feed(content)
+        parser.close()
+        for _, elem in parser.read_events():
+            yield elem
+            elem.clear()
+
+    def _extract_date_from_page(self, text: str) -> Optional[str]:
+        """Extrae la fecha de la competición del HTML de la página."""
         
         # Buscar patrón "Sábado, 31 de Enero de 2026" o similar
         months_es = {
@@ -186,8 +389,7 @@ class FMNScraper:
             'septiembre': '09', 'octubre': '10', 'noviembre': '11', 'diciembre': '12'
         }
         
-        pattern = r'(\d{1,2})\s+de\s+(\w+)\s+de\s+(\d{4})'
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = _DATE_RE.search(text)
         if match:
             day = match.group(1).zfill(2)
             month_name = match.group(2).lower()
@@ -197,31 +399,35 @@ class FMNScraper:
         
         return None
 
-    def _get_competitions_from_page(self, page_num: int) -> List[Dict]:
+    def _get_competitions_from_page(self, page_num: int) -> List[Competition]:
         """Obtiene las competiciones de una página del calendario."""
         competitions = []
-        
+        seen_ids: Set[str] = set()
+
         if page_num == 1:
             url = self.CALENDAR_URL
         else:
             url = f"{self.CALENDAR_URL}?page={page_num}"
-        
-        response = self._make_request(url)
-        if not response:
-            return competitions
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Reutilizar el HTML que ya descargó _detect_total_pages
+        if page_num == 1 and self._page1_content is not None:
+            content = self._page1_content
+            self._page1_content = None  # solo se necesita una vez
+        else:
+            content = self._fetch_calendar_page(url)
+            if content is None:
+                return competitions
 
         # Buscar enlaces a competiciones individuales
         # Formato: /index.php/competiciones-natacion/XXX-nombre-competicion
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            
+        for link in self._iter_anchors(content):
+            href = link.get('href')
+
             # Solo enlaces de competiciones con ID numérico
-            if '/competiciones-natacion/' not in href:
+            if not href or '/competiciones-natacion/' not in href:
                 continue
-            
-            match = re.search(r'/competiciones-natacion/(\d+)-(.+?)(?:/|$)', href)
+
+            match = _COMP_LINK_RE.search(href)
             if not match:
                 continue
             
@@ -229,35 +435,35 @@ class FMNScraper:
             
             # Verificar si ya fue descargada previamente (del registro)
             if comp_id in self.processed_competitions:
-                self.stats['competitions_already_downloaded'] += 1
+                self._inc_stat('competitions_already_downloaded')
                 continue
             
-            # Construir URL completa
-            full_url = urljoin(self.BASE_URL, href.split('?')[0])
-            
-            # Obtener título
-            title = link.get_text(strip=True)
+            # Obtener título (itertext porque el pull parser produce
+            # elementos etree planos, sin text_content)
+            title = ''.join(link.itertext()).strip()
             if not title or len(title) < 5:
                 continue
-            
+
             # Limpiar título (a veces viene con texto adicional)
-            title = re.sub(r'^NATACIÓN', '', title).strip()
-            
+            title = _TITLE_PREFIX_RE.sub('', title).strip()
+
             # Extraer año de temporada (para filtrado inicial)
-            season_year = self._extract_year_from_text(title)
-            
-            # Filtrar por rango de años
+            season_year = _extract_year_from_text(title, self.start_year, self.end_year)
+
+            # Filtrar por rango de años antes de construir la URL: la mayoría
+            # de descartes ocurren aquí y se ahorran el urljoin
             if not (self.start_year <= season_year <= self.end_year):
                 continue
-            
+
             # Añadir a lista temporal (no marcar como procesada aún)
-            if comp_id not in [c['id'] for c in competitions]:
-                competitions.append({
-                    'id': comp_id,
-                    'url': full_url,
-                    'title': title,
-                    'season_year': season_year
-                })
+            if comp_id not in seen_ids:
+                seen_ids.add(comp_id)
+                competitions.append(Competition(
+                    id=comp_id,
+                    url=urljoin(self.BASE_URL, href.split('?')[0]),
+                    title=title,
+                    season_year=season_year
+                ))
 
         return competitions
 
@@ -271,43 +477,62 @@ class FMNScraper:
         response = self._make_request(competition_url)
         if not response:
             return None
+        content = response.content
+
+        # Extraer fecha de la página: el patrón aparece como texto plano,
+        # así que basta el regex sobre el HTML sin construir ningún árbol
+        date_str = self._extract_date_from_page(content.decode('utf-8', errors='ignore'))
+
+        # Recorrer solo los <a> con el mismo pull parser del calendario;
+        # el texto se materializa únicamente para los pocos enlaces .zip
+        zip_candidates = []  # (href, texto visible)
+        for link in self._iter_anchors(content):
+            href = link.get('href')
+            if not href or '.zip' not in href.lower():
+                continue
+            zip_candidates.append((href, ''.join(link.itertext()).strip().lower()))
+
+        # El enlace debe tener texto ".res" y apuntar a un .zip
+        for href, text in zip_candidates:
+            if text == '.res':
+                return (urljoin(self.BASE_URL, href), date_str)
+
+        # Alternativa: buscar cualquier enlace .zip bajo una ruta /res
+        for href, _ in zip_candidates:
+            if '/res' in href.lower():
+                return (urljoin(self.BASE_URL, href), date_str)
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Extraer fecha de la página
-        date_str = self._extract_date_from_page(soup)
-        
-        # Buscar enlaces con texto ".res" que apunten a archivos .zip
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            text = link.get_text(strip=True).lower()
-            
-            # El enlace debe tener texto ".res" y apuntar a un .zip
-            if text == '.res' and '.zip' in href.lower():
-                zip_url = urljoin(self.BASE_URL, href)
-                return (zip_url, date_str)
-        
-        # Alternativa: buscar cualquier enlace .zip en la tabla de la competición
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if '.zip' in href.lower() and '/res' in href.lower():
-                zip_url = urljoin(self.BASE_URL, href)
-                return (zip_url, date_str)
-        
         return None
 
+    def _remote_file_size(self, url: str) -> Optional[int]:
+        """Obtiene el tamaño remoto (Content-Length) con una petición HEAD."""
+        try:
+            self._throttle()
+            response = self.session.head(url, timeout=30, allow_redirects=True)
+            response.raise_for_status()
+            size = response.headers.get('Content-Length')
+            return int(size) if size and size.isdigit() else None
+        except requests.exceptions.RequestException:
+            return None
+
     def _download_file(self, url: str, save_path: Path) -> bool:
         """Descarga un archivo y lo guarda en la ruta especificada."""
         if url in self.downloaded_files:
             logger.info(f"    Ya descargado anteriormente")
-            self.stats['files_skipped'] += 1
+            self._inc_stat('files_skipped')
             return False
 
         if save_path.exists():
-            logger.info(f"    Archivo ya existe: {save_path.name}")
-            self.stats['files_skipped'] += 1
-            self.downloaded_files.add(url)
-            return False
+            # Una petición HEAD es mucho más barata que re-descargar el ZIP:
+            # si el tamaño remoto coincide con el local, el archivo está completo
+            remote_size = self._remote_file_size(url)
+            if remote_size is None or remote_size == save_path.stat().st_size:
+                logger.info(f"    Archivo ya existe: {save_path.name}")
+                self._inc_stat('files_skipped')
+                self.downloaded_files.add(url)
+                self._registry_dirty = True
+                return False
+            logger.info(f"    Archivo incompleto ({save_path.stat().st_size} de {remote_size} bytes), re-descargando")
 
         try:
             response = self._make_request(url, stream=True)
@@ -323,48 +548,69 @@ class FMNScraper:
             # Crear directorio
             save_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Descargar
+            # Descargar en bloques de 1 MiB directamente desde el socket,
+            # calculando el SHA256 sobre la marcha (sin releer el archivo)
+            sha256 = hashlib.sha256()
+            response.raw.decode_content = True
             with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                while True:
+                    chunk = response.raw.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    sha256.update(chunk)
                     f.write(chunk)
 
+            # Mismo contenido ya descargado bajo otra URL u otro nombre
+            digest = sha256.hexdigest()
+            if digest in self.file_hashes:
+                logger.info(f"    Contenido duplicado (SHA256 ya registrado): {save_path.name}")
+                save_path.unlink()
+                self.downloaded_files.add(url)
+                self._registry_dirty = True
+                self._inc_stat('files_skipped')
+                return False
+            self.file_hashes.add(digest)
+            self._registry_dirty = True
+
             file_size = save_path.stat().st_size
             logger.info(f"    ✓ Descargado: {save_path.name} ({file_size / 1024:.1f} KB)")
-            
+
             self.downloaded_files.add(url)
-            self.stats['files_downloaded'] += 1
+            self._registry_dirty = True
+            self._inc_stat('files_downloaded')
             return True
 
         except IOError as e:
             logger.error(f"    ✗ Error al guardar: {e}")
-            self.stats['errors'] += 1
+            self._inc_stat('errors')
             return False
 
-    def _process_competition(self, competition: Dict) -> None:
+    def _process_competition(self, competition: Competition) -> None:
         """Procesa una competición: busca y descarga el ZIP con .res."""
-        logger.info(f"  [{competition['id']}] {competition['title'][:60]}")
+        logger.info(f"  [{competition.id}] {competition.title[:60]}")
         
         # Buscar enlace al ZIP
-        result = self._find_res_zip_link(competition['url'])
+        result = self._find_res_zip_link(competition.url)
         
         if not result:
             logger.info(f"    - No tiene archivo .res")
             # Marcar como procesada aunque no tenga .res (para no volver a revisar)
-            self.processed_competitions.add(competition['id'])
+            self.processed_competitions.add(competition.id)
+            self._registry_dirty = True
             return
         
         zip_url, date_str = result
-        self.stats['competitions_with_res'] += 1
+        self._inc_stat('competitions_with_res')
         
         # Determinar el año REAL de la competición desde la fecha
         if date_str:
             # Extraer año de la fecha (formato: YYYY-MM-DD)
             competition_year = int(date_str.split('-')[0])
-            filename = f"{date_str}__{self._sanitize_filename(competition['title'])}.zip"
+            filename = f"{date_str}__{_sanitize_filename(competition.title)}.zip"
         else:
             # Fallback al año de temporada si no hay fecha
-            competition_year = competition['season_year']
-            filename = f"{competition_year}__{self._sanitize_filename(competition['title'])}.zip"
+            competition_year = competition.season_year
+            filename = f"{competition_year}__{_sanitize_filename(competition.title)}.zip"
         
         # Ruta de guardado usando el año REAL
         year_dir = self.output_base_dir / str(competition_year)
@@ -373,30 +619,32 @@ class FMNScraper:
         # Descargar
         if self._download_file(zip_url, save_path):
             # Solo marcar como procesada si se descargó correctamente
-            self.processed_competitions.add(competition['id'])
+            self.processed_competitions.add(competition.id)
+            self._registry_dirty = True
         else:
             # También marcar si ya existía
-            self.processed_competitions.add(competition['id'])
+            self.processed_competitions.add(competition.id)
+            self._registry_dirty = True
 
     def _detect_total_pages(self) -> int:
         """Detecta el número total de páginas del calendario."""
         response = self._make_request(self.CALENDAR_URL)
         if not response:
             return 100  # Fallback conservador
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Buscar el enlace a la última página (normalmente muestra el número)
+
+        # Guardar el HTML para que la página 1 del calendario no se re-pida,
+        # junto con sus validadores de caché para futuras ejecuciones
+        self._page1_content = response.content
+        self._store_validators(self.CALENDAR_URL, response)
+
+        # Buscar la última página: basta el número más alto que aparezca en
+        # un parámetro ?page=, así que un regex sobre los bytes crudos evita
+        # parsear la página dos veces (el parseo real lo hará la página 1)
         max_page = 1
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            text = link.get_text(strip=True)
-            
-            # Buscar enlaces de paginación con números
-            if '?page=' in href and text.isdigit():
-                page_num = int(text)
-                if page_num > max_page:
-                    max_page = page_num
+        for match in _PAGE_PARAM_RE.finditer(response.content):
+            page_num = int(match.group(1))
+            if page_num > max_page:
+                max_page = page_num
         
         logger.info(f"Detectadas {max_page} páginas en el calendario")
         return max_page
@@ -424,38 +672,59 @@ class FMNScraper:
         # Iterar por todas las páginas del calendario
         page = 1
         consecutive_empty = 0
-        
-        while page <= self.max_pages:
-            logger.info(f"\n--- Página {page}/{self.max_pages} del calendario ---")
-            
-            competitions = self._get_competitions_from_page(page)
-            self.stats['pages_scraped'] += 1
-            
-            if not competitions:
-                # Verificar si hay competiciones pero todas ya descargadas
-                if self.stats['competitions_already_downloaded'] > 0:
-                    logger.info("Todas las competiciones de esta página ya fueron descargadas")
-                    consecutive_empty = 0  # Resetear contador
+
+        # Las competiciones de cada página se procesan en paralelo: el cuello
+        # de botella es la latencia de red y los hilos comparten la sesión
+        # (el ritmo global lo limita _throttle)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while page <= self.max_pages:
+                logger.info(f"\n--- Página {page}/{self.max_pages} del calendario ---")
+
+                pages_not_modified_before = self.stats['pages_not_modified']
+                competitions = self._get_competitions_from_page(page)
+                self.stats['pages_scraped'] += 1
+
+                # Re-filtrar en bloque contra el registro justo antes de lanzar
+                # peticiones: una competición repetida en varias páginas puede
+                # haber entrado al registro después de parsear esta página
+                new_competitions = [
+                    c for c in competitions
+                    if c.id not in self.processed_competitions
+                ]
+                if len(new_competitions) != len(competitions):
+                    self._inc_stat(
+                        'competitions_already_downloaded',
+                        len(competitions) - len(new_competitions)
+                    )
+                competitions = new_competitions
+
+                if not competitions:
+                    # Una página sin cambios (304) no cuenta como vacía
+                    if self.stats['pages_not_modified'] > pages_not_modified_before:
+                        consecutive_empty = 0
+                    # Verificar si hay competiciones pero todas ya descargadas
+                    elif self.stats['competitions_already_downloaded'] > 0:
+                        logger.info("Todas las competiciones de esta página ya fueron descargadas")
+                        consecutive_empty = 0  # Resetear contador
+                    else:
+                        consecutive_empty += 1
+                        logger.info(f"No hay competiciones nuevas (vacías consecutivas: {consecutive_empty})")
+                        # Si hay 3 páginas vacías consecutivas, probablemente terminamos
+                        if consecutive_empty >= 3:
+                            logger.info("3 páginas vacías consecutivas, finalizando...")
+                            break
                 else:
-                    consecutive_empty += 1
-                    logger.info(f"No hay competiciones nuevas (vacías consecutivas: {consecutive_empty})")
-                    # Si hay 3 páginas vacías consecutivas, probablemente terminamos
-                    if consecutive_empty >= 3:
-                        logger.info("3 páginas vacías consecutivas, finalizando...")
-                        break
-            else:
-                consecutive_empty = 0
-                logger.info(f"Encontradas {len(competitions)} competiciones nuevas")
-                self.stats['competitions_found'] += len(competitions)
-                
-                # Procesar cada competición
-                for comp in competitions:
-                    self._process_competition(comp)
-                
-                # Guardar registro periódicamente
-                self._save_registry()
-            
-            page += 1
+                    consecutive_empty = 0
+                    logger.info(f"Encontradas {len(competitions)} competiciones nuevas")
+                    self.stats['competitions_found'] += len(competitions)
+
+                    # Procesar cada competición en paralelo
+                    list(executor.map(self._process_competition, competitions))
+
+                    # Guardar registro periódicamente
+                    self._save_registry()
+
+                page += 1
 
         # Guardar registro final
         self._save_registry()
@@ -470,6 +739,7 @@ class FMNScraper:
         logger.info(f"Competiciones con .res: {self.stats['competitions_with_res']}")
         logger.info(f"Archivos descargados: {self.stats['files_downloaded']}")
         logger.info(f"Archivos omitidos: {self.stats['files_skipped']}")
+        logger.info(f"Páginas sin cambios (304): {self.stats['pages_not_modified']}")
         logger.info(f"Errores: {self.stats['errors']}")
         logger.info(f"Total competiciones en registro: {len(self.processed_competitions)}")
         logger.info("=" * 60)